@@ -1,7 +1,14 @@
-from .server import serve
 import os
 
 
+def __getattr__(name):
+    # serve pulls in httpx and the MCP SDK, so it is only imported on first use
+    if name == "serve":
+        from .server import serve
+        return serve
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def main():
     """MCP Check Server - Check CVE functionality for MCP
     The API key is read from the CHECK_API_KEY environment variable by default.
@@ -17,6 +24,8 @@ def main():
     args = parser.parse_args()
     if not args.apikey:
         raise RuntimeError("API key must be provided via --apikey or CHECK_API_KEY environment variable.")
+    from .server import serve
+
     asyncio.run(serve(args.apikey))
 
 
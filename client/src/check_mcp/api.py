@@ -0,0 +1,211 @@
+from collections import OrderedDict
+from typing import Any, Optional
+from mcp.shared.exceptions import McpError
+from mcp.types import ErrorData, INTERNAL_ERROR
+import asyncio
+import httpx
+import logging
+import orjson
+import random
+import time
+
+logger = logging.getLogger(__name__)
+
+# Connect failures should abort quickly, while slow reads still get headroom
+CONNECT_TIMEOUT = 3.0
+READ_TIMEOUT = 25.0
+WRITE_TIMEOUT = 5.0
+POOL_TIMEOUT = 2.0
+
+TIMEOUT = httpx.Timeout(connect=CONNECT_TIMEOUT, read=READ_TIMEOUT, write=WRITE_TIMEOUT, pool=POOL_TIMEOUT)
+
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 20
+
+LIMITS = httpx.Limits(max_connections=MAX_CONNECTIONS, max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS)
+
+# Callers beyond the pool size wait here instead of timing out inside httpx's pool
+_inflight = asyncio.Semaphore(MAX_CONNECTIONS)
+
+# Idempotent GETs are retried on connection failures and gateway errors with jittered exponential backoff.
+# Read timeouts are not retried, so a slow API still fails after READ_TIMEOUT.
+RETRIES = 3
+RETRY_BASE = 0.1
+RETRY_CAP = 2.0
+RETRY_STATUSES = frozenset({502, 503, 504})
+RETRY_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.RemoteProtocolError, httpx.PoolTimeout)
+
+# CVE and release data changes slowly, so identical queries are answered from memory for a while
+CACHE_TTL = 300
+CACHE_MAXSIZE = 512
+
+class _TTLCache:
+    """Least-recently-used cache whose entries expire after CACHE_TTL seconds."""
+
+    def __init__(self, maxsize: int = CACHE_MAXSIZE, ttl: float = CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Any, tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Any) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def set(self, key: Any, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+_cache = _TTLCache()
+
+# Under concurrent load, requests are collected for this long so identical queries can share one API call
+BATCH_WINDOW_MS = 5
+
+class _RequestBatcher:
+    """Coalesces concurrent GETs so identical queries share a single API call.
+
+    The batch adapts to the number of pending requests: a lone request is
+    sent right away, while one that arrives with others queued waits up to
+    BATCH_WINDOW_MS for more, and every pending request joins the batch.
+    Each distinct (url, params) in the batch is fetched once, concurrently,
+    and its result or error is handed to every caller that asked for it.
+    """
+
+    def __init__(self, window_ms: int = BATCH_WINDOW_MS):
+        self.window = window_ms / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._dispatches: set[asyncio.Task] = set()
+
+    def start(self) -> None:
+        """Start the background consumer if it is not already running."""
+        if self._task is None or self._task.done():
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the consumer and cancel any request that has not completed."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        for task in list(self._dispatches):
+            task.cancel()
+        await asyncio.gather(self._task, *self._dispatches, return_exceptions=True)
+        self._task = None
+        while not self._queue.empty():
+            self._queue.get_nowait()[-1].cancel()
+
+    async def submit(self, key: Any, client: httpx.AsyncClient, url: str, params: Optional[dict], api_name: str) -> Any:
+        """Queue a GET for the next batch and wait for its decoded JSON response.
+
+        Requests with equal keys in the same batch share one API call.
+        """
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((key, client, url, params, api_name, future))
+        return await future
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            try:
+                # Let requests submitted in the same loop iteration queue up
+                await asyncio.sleep(0)
+                if self._queue.qsize():
+                    # Concurrent traffic, so waiting is likely to coalesce more
+                    await asyncio.sleep(self.window)
+            except asyncio.CancelledError:
+                for *_, future in batch:
+                    future.cancel()
+                raise
+            for _ in range(self._queue.qsize()):
+                batch.append(self._queue.get_nowait())
+            groups: dict[Any, tuple[tuple, list[asyncio.Future]]] = {}
+            for key, client, url, params, api_name, future in batch:
+                groups.setdefault(key, ((client, url, params, api_name), []))[1].append(future)
+            for request, futures in groups.values():
+                task = asyncio.create_task(self._dispatch(request, futures))
+                self._dispatches.add(task)
+                task.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(self, request: tuple, futures: list[asyncio.Future]) -> None:
+        try:
+            data = await _fetch_json(*request)
+        except asyncio.CancelledError:
+            for future in futures:
+                future.cancel()
+            raise
+        except Exception as e:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for future in futures:
+                if not future.done():
+                    future.set_result(data)
+
+request_batcher = _RequestBatcher()
+
+async def get_json(client: httpx.AsyncClient, url: str, params: Optional[dict], api_name: str) -> Any:
+    """GET a URL from the Opsify API and decode the JSON response.
+
+    Successful responses are cached per (url, params) for CACHE_TTL seconds;
+    failed requests, including 5xx responses, are never cached.
+
+    Args:
+        client: Shared HTTP client
+        url: Endpoint URL
+        params: Query parameters
+        api_name: Name of the API used in error messages (e.g., "CVE")
+    """
+    key = (url, tuple(sorted(params.items())) if params else ())
+    data = _cache.get(key)
+    if data is not None:
+        return data
+    data = await request_batcher.submit(key, client, url, params, api_name)
+    _cache.set(key, data)
+    return data
+
+async def _get_with_retry(client: httpx.AsyncClient, url: str, params: Optional[dict], retries: int = RETRIES) -> httpx.Response:
+    """GET a URL, retrying RETRY_ERRORS and RETRY_STATUSES responses.
+
+    The last error or response is returned to the caller once retries are exhausted.
+    """
+    for attempt in range(retries + 1):
+        try:
+            async with _inflight:
+                resp = await client.get(url, params=params)
+        except RETRY_ERRORS:
+            if attempt == retries:
+                raise
+        else:
+            if resp.status_code not in RETRY_STATUSES or attempt == retries:
+                return resp
+        await asyncio.sleep(min(RETRY_CAP, RETRY_BASE * 2 ** attempt) + random.uniform(0, RETRY_BASE))
+
+async def _fetch_json(client: httpx.AsyncClient, url: str, params: Optional[dict], api_name: str) -> Any:
+    """Perform the GET and decode it, mapping HTTP failures to McpError."""
+    try:
+        resp = await _get_with_retry(client, url, params)
+    except httpx.ConnectTimeout:
+        raise McpError(ErrorData(code=INTERNAL_ERROR, message=f"Timed out connecting to {api_name} API after {CONNECT_TIMEOUT}s"))
+    except httpx.ReadTimeout:
+        raise McpError(ErrorData(code=INTERNAL_ERROR, message=f"{api_name} API did not respond within {READ_TIMEOUT}s"))
+    except httpx.RequestError as e:
+        raise McpError(ErrorData(code=INTERNAL_ERROR, message=f"Failed to query {api_name} API: {e}"))
+    try:
+        resp.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        raise McpError(ErrorData(code=INTERNAL_ERROR, message=f"{api_name} API returned {e.response.status_code}: {e.response.text[:200]}"))
+    logger.debug("GET %s: Content-Encoding=%s", url, resp.headers.get("Content-Encoding"))
+    try:
+        return orjson.loads(resp.content)
+    except orjson.JSONDecodeError as e:
+        raise McpError(ErrorData(code=INTERNAL_ERROR, message=f"Invalid JSON from {api_name} API: {e}"))
@@ -1,6 +1,11 @@
+import os
+
+# Read once at import; point this at a local or mock API for testing
+_BASE_URL = os.getenv("OPSIFY_API_BASE_URL", "https://api.opsify.dev").rstrip("/")
+
 class APIConfig:
-    release_endpoint = "https://api.opsify.dev/checks/release"
-    cve_endpoint = "https://api.opsify.dev/checks/cve"
+    release_endpoint = f"{_BASE_URL}/checks/release"
+    cve_endpoint = f"{_BASE_URL}/checks/cve"
 
 class Config:
-    api = APIConfig() 
\ No newline at end of file
+    api = APIConfig()
@@ -1,8 +1,11 @@
+from itertools import islice
 from typing import Optional, List
 from mcp.shared.exceptions import McpError
 from mcp.types import ErrorData, TextContent, INVALID_PARAMS, INTERNAL_ERROR
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
 import httpx
+import io
+from .api import get_json
 from .config import Config
 
 class SearchCVEParams(BaseModel):
@@ -20,30 +23,38 @@ class SearchCVEParams(BaseModel):
     skip: Optional[int] = Field(0, description="Number of records to skip (pagination)")
     limit: Optional[int] = Field(100, description="Maximum number of records to return (pagination)")
 
-async def search_cve(arguments: dict, apikey: str) -> list[TextContent]:
-    try:
-        args = SearchCVEParams(**arguments)
-    except ValueError as e:
-        raise McpError(ErrorData(code=INVALID_PARAMS, message=str(e)))
-    params = {k: v for k, v in args.dict().items() if v is not None}
-    headers = {"apikey": apikey}
-    async with httpx.AsyncClient() as client:
-        try:
-            resp = await client.get(f"{Config.api.cve_endpoint}/search", params=params, headers=headers, timeout=30)
-            resp.raise_for_status()
-        except httpx.HTTPError as e:
-            raise McpError(ErrorData(code=INTERNAL_ERROR, message=f"Failed to query CVE API: {e}"))
-        try:
-            data = resp.json()
-        except Exception as e:
-            raise McpError(ErrorData(code=INTERNAL_ERROR, message=f"Invalid JSON from CVE API: {e}"))
+_CVE_KEYS = ("cve_id", "state", "published_date", "score", "title", "vendor", "description")
+
+def _format_cve(cve: dict) -> str:
+    """Format a single CVE record as a text block for the tool response."""
+    g = cve.get
+    cve_id, state, published, score, title, vendor, description = [g(k, "") for k in _CVE_KEYS]
+    refs = ", ".join(g("references") or ())
+    return f"CVE ID: {cve_id}\nState: {state}\nPublished: {published}\nScore: {score}\nTitle: {title}\nVendor: {vendor}\nDescription: {description}\nReferences: {refs}\n---"
+
+async def _query_cves(client: httpx.AsyncClient, url: str, params: Optional[dict], api_name: str, empty_message: str) -> list[TextContent]:
+    """Fetch a list of CVEs and format it as the tool response.
+
+    Shared by every tool that returns CVE records, so they all validate and
+    format the response the same way.
+    """
+    data = await get_json(client, url, params, api_name)
     if not isinstance(data, list):
-        raise McpError(ErrorData(code=INTERNAL_ERROR, message="Unexpected response format from CVE API"))
+        raise McpError(ErrorData(code=INTERNAL_ERROR, message=f"Unexpected response format from {api_name} API"))
     if not data:
-        return [TextContent(type="text", text="No CVEs found for the given criteria.")]
-    results = []
-    for cve in data:
-        results.append(
-            f"CVE ID: {cve.get('cve_id', '')}\nState: {cve.get('state', '')}\nPublished: {cve.get('published_date', '')}\nScore: {cve.get('score', '')}\nTitle: {cve.get('title', '')}\nVendor: {cve.get('vendor', '')}\nDescription: {cve.get('description', '')}\nReferences: {', '.join(cve.get('references', []))}\n---"
-        )
-    return [TextContent(type="text", text="\n\n".join(results))] 
\ No newline at end of file
+        return [TextContent(type="text", text=empty_message)]
+    buf = io.StringIO()
+    write = buf.write
+    write(_format_cve(data[0]))
+    for cve in islice(data, 1, None):
+        write("\n\n")
+        write(_format_cve(cve))
+    return [TextContent(type="text", text=buf.getvalue())]
+
+async def search_cve(arguments: dict, client: httpx.AsyncClient) -> list[TextContent]:
+    try:
+        args = SearchCVEParams.model_validate(arguments)
+    except ValidationError as e:
+        raise McpError(ErrorData(code=INVALID_PARAMS, message=str(e)))
+    params = args.model_dump(exclude_none=True)
+    return await _query_cves(client, f"{Config.api.cve_endpoint}/search", params, "CVE", "No CVEs found for the given criteria.") 
\ No newline at end of file
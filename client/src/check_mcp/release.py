@@ -1,9 +1,11 @@
 from typing import Optional, List
 from mcp.shared.exceptions import McpError
 from mcp.types import ErrorData, TextContent, INVALID_PARAMS, INTERNAL_ERROR
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
 import httpx
+from .api import get_json
 from .config import Config
+from .cve import _query_cves
 
 class SearchReleaseParams(BaseModel):
     vendor: Optional[str] = Field(None, description="Optional vendor name to filter by (case-insensitive)")
@@ -28,23 +30,13 @@ class GetSpecificVersionParams(BaseModel):
     version: str = Field(..., description="Specific version to retrieve (e.g., '1.0.0')")
     vendor: Optional[str] = Field(None, description="Optional vendor name to filter by (case-insensitive)")
 
-async def search_release(arguments: dict, apikey: str) -> list[TextContent]:
+async def search_release(arguments: dict, client: httpx.AsyncClient) -> list[TextContent]:
     try:
-        args = SearchReleaseParams(**arguments)
-    except ValueError as e:
+        args = SearchReleaseParams.model_validate(arguments)
+    except ValidationError as e:
         raise McpError(ErrorData(code=INVALID_PARAMS, message=str(e)))
-    params = {k: v for k, v in args.dict().items() if v is not None}
-    headers = {"apikey": apikey}
-    async with httpx.AsyncClient() as client:
-        try:
-            resp = await client.get(f"{Config.api.release_endpoint}/search", params=params, headers=headers, timeout=30)
-            resp.raise_for_status()
-        except httpx.HTTPError as e:
-            raise McpError(ErrorData(code=INTERNAL_ERROR, message=f"Failed to query Release API: {e}"))
-        try:
-            data = resp.json()
-        except Exception as e:
-            raise McpError(ErrorData(code=INTERNAL_ERROR, message=f"Invalid JSON from Release API: {e}"))
+    params = args.model_dump(exclude_none=True)
+    data = await get_json(client, f"{Config.api.release_endpoint}/search", params, "Release")
     if not isinstance(data, list):
         raise McpError(ErrorData(code=INTERNAL_ERROR, message="Unexpected response format from Release API"))
     if not data:
@@ -56,89 +48,43 @@ async def search_release(arguments: dict, apikey: str) -> list[TextContent]:
         )
     return [TextContent(type="text", text="\n\n".join(results))]
 
-async def get_version_cves(arguments: dict, apikey: str) -> list[TextContent]:
+async def get_version_cves(arguments: dict, client: httpx.AsyncClient) -> list[TextContent]:
     try:
-        args = GetVersionCVEsParams(**arguments)
-    except ValueError as e:
+        args = GetVersionCVEsParams.model_validate(arguments)
+    except ValidationError as e:
         raise McpError(ErrorData(code=INVALID_PARAMS, message=str(e)))
     product_name = args.product_name
     version = args.version
     vendor = args.vendor
-    headers = {"apikey": apikey}
     endpoint = f"{Config.api.release_endpoint}/{product_name}/{version}/cves"
-    params = {}
-    if vendor:
-        params["vendor"] = vendor
-    async with httpx.AsyncClient() as client:
-        try:
-            resp = await client.get(endpoint, params=params, headers=headers, timeout=30)
-            resp.raise_for_status()
-        except httpx.HTTPError as e:
-            raise McpError(ErrorData(code=INTERNAL_ERROR, message=f"Failed to query Version CVEs API: {e}"))
-        try:
-            data = resp.json()
-        except Exception as e:
-            raise McpError(ErrorData(code=INTERNAL_ERROR, message=f"Invalid JSON from Version CVEs API: {e}"))
-    if not isinstance(data, list):
-        raise McpError(ErrorData(code=INTERNAL_ERROR, message="Unexpected response format from Version CVEs API"))
-    if not data:
-        return [TextContent(type="text", text="No CVEs found for the given product version.")]
-    results = []
-    for cve in data:
-        results.append(
-            f"CVE ID: {cve.get('cve_id', '')}\nState: {cve.get('state', '')}\nPublished: {cve.get('published_date', '')}\nScore: {cve.get('score', '')}\nTitle: {cve.get('title', '')}\nVendor: {cve.get('vendor', '')}\nDescription: {cve.get('description', '')}\nReferences: {', '.join(cve.get('references', []))}\n---"
-        )
-    return [TextContent(type="text", text="\n\n".join(results))]
+    params = {"vendor": vendor} if vendor else None
+    return await _query_cves(client, endpoint, params, "Version CVEs", "No CVEs found for the given product version.")
 
-async def get_latest_version(arguments: dict, apikey: str) -> list[TextContent]:
+async def get_latest_version(arguments: dict, client: httpx.AsyncClient) -> list[TextContent]:
     try:
-        args = GetLatestVersionParams(**arguments)
-    except ValueError as e:
+        args = GetLatestVersionParams.model_validate(arguments)
+    except ValidationError as e:
         raise McpError(ErrorData(code=INVALID_PARAMS, message=str(e)))
     product_name = args.product_name
     vendor = args.vendor
-    headers = {"apikey": apikey}
     endpoint = f"{Config.api.release_endpoint}/{product_name}/latest"
-    params = {}
-    if vendor:
-        params["vendor"] = vendor
-    async with httpx.AsyncClient() as client:
-        try:
-            resp = await client.get(endpoint, params=params, headers=headers, timeout=30)
-            resp.raise_for_status()
-        except httpx.HTTPError as e:
-            raise McpError(ErrorData(code=INTERNAL_ERROR, message=f"Failed to query Latest Version API: {e}"))
-        try:
-            data = resp.json()
-        except Exception as e:
-            raise McpError(ErrorData(code=INTERNAL_ERROR, message=f"Invalid JSON from Latest Version API: {e}"))
+    params = {"vendor": vendor} if vendor else None
+    data = await get_json(client, endpoint, params, "Latest Version")
     if not data:
         return [TextContent(type="text", text="No latest version found for the given product.")]
     return [TextContent(type="text", text=str(data))]
 
-async def get_specific_version(arguments: dict, apikey: str) -> list[TextContent]:
+async def get_specific_version(arguments: dict, client: httpx.AsyncClient) -> list[TextContent]:
     try:
-        args = GetSpecificVersionParams(**arguments)
-    except ValueError as e:
+        args = GetSpecificVersionParams.model_validate(arguments)
+    except ValidationError as e:
         raise McpError(ErrorData(code=INVALID_PARAMS, message=str(e)))
     product_name = args.product_name
     version = args.version
     vendor = args.vendor
-    headers = {"apikey": apikey}
     endpoint = f"{Config.api.release_endpoint}/{product_name}/{version}"
-    params = {}
-    if vendor:
-        params["vendor"] = vendor
-    async with httpx.AsyncClient() as client:
-        try:
-            resp = await client.get(endpoint, params=params, headers=headers, timeout=30)
-            resp.raise_for_status()
-        except httpx.HTTPError as e:
-            raise McpError(ErrorData(code=INTERNAL_ERROR, message=f"Failed to query Specific Version API: {e}"))
-        try:
-            data = resp.json()
-        except Exception as e:
-            raise McpError(ErrorData(code=INTERNAL_ERROR, message=f"Invalid JSON from Specific Version API: {e}"))
+    params = {"vendor": vendor} if vendor else None
+    data = await get_json(client, endpoint, params, "Specific Version")
     if not data:
         return [TextContent(type="text", text="No version found for the given product and version.")]
     return [TextContent(type="text", text=str(data))] 
\ No newline at end of file
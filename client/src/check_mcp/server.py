@@ -10,52 +10,69 @@ from mcp.types import (
     INVALID_PARAMS,
     INTERNAL_ERROR,
 )
+from .api import LIMITS, TIMEOUT, request_batcher
 from .cve import SearchCVEParams, search_cve
 from .release import SearchReleaseParams, GetVersionCVEsParams, search_release, get_version_cves
 from .release import GetLatestVersionParams, GetSpecificVersionParams, get_latest_version, get_specific_version
+from typing import Optional
+import httpx
 import os
 
+# Tool definitions are static, so their JSON schemas are generated once at import
+_TOOLS = [
+    Tool(
+        name="search_cve",
+        description="Search CVEs with various filters via the Opsify API.",
+        inputSchema=SearchCVEParams.model_json_schema(),
+    ),
+    Tool(
+        name="search_release",
+        description="Search releases with optional filters for vendor, product name, and date range. Supports pagination.",
+        inputSchema=SearchReleaseParams.model_json_schema(),
+    ),
+    Tool(
+        name="get_version_cves",
+        description="Get CVEs for a specific version of a product. Optionally filter by vendor. Uses caching (TTL: 1 day).",
+        inputSchema=GetVersionCVEsParams.model_json_schema(),
+    ),
+    Tool(
+        name="get_latest_version",
+        description="Get the latest version information for a product. Optionally filter by vendor.",
+        inputSchema=GetLatestVersionParams.model_json_schema(),
+    ),
+    Tool(
+        name="get_specific_version",
+        description="Get a specific version of a product. Optionally filter by vendor.",
+        inputSchema=GetSpecificVersionParams.model_json_schema(),
+    ),
+]
+
 async def serve(
     apikey: str = os.getenv("CHECK_API_KEY"),
+    transport: Optional[httpx.AsyncBaseTransport] = None,
 ) -> None:
     """Run the check MCP server.
 
     Args:
         apikey: API key to use for requests (must be provided via CHECK_API_KEY environment variable or CLI)
+        transport: Optional HTTP transport for the API client (e.g., httpx.MockTransport in tests)
     """
     if not apikey:
         raise RuntimeError("API key must be provided via CHECK_API_KEY environment variable or CLI argument.")
     server = Server("mcp-check")
+    # One pooled client for the whole session so connections to the API are reused;
+    # HTTP/2 multiplexes concurrent queries over one connection and falls back to HTTP/1.1
+    client = httpx.AsyncClient(
+        headers={"apikey": apikey},
+        limits=LIMITS,
+        timeout=TIMEOUT,
+        http2=True,
+        transport=transport,
+    )
 
     @server.list_tools()
     async def list_tools() -> list[Tool]:
-        return [
-            Tool(
-                name="search_cve",
-                description="Search CVEs with various filters via the Opsify API.",
-                inputSchema=SearchCVEParams.model_json_schema(),
-            ),
-            Tool(
-                name="search_release",
-                description="Search releases with optional filters for vendor, product name, and date range. Supports pagination.",
-                inputSchema=SearchReleaseParams.model_json_schema(),
-            ),
-            Tool(
-                name="get_version_cves",
-                description="Get CVEs for a specific version of a product. Optionally filter by vendor. Uses caching (TTL: 1 day).",
-                inputSchema=GetVersionCVEsParams.model_json_schema(),
-            ),
-            Tool(
-                name="get_latest_version",
-                description="Get the latest version information for a product. Optionally filter by vendor.",
-                inputSchema=GetLatestVersionParams.model_json_schema(),
-            ),
-            Tool(
-                name="get_specific_version",
-                description="Get a specific version of a product. Optionally filter by vendor.",
-                inputSchema=GetSpecificVersionParams.model_json_schema(),
-            ),
-        ]
+        return _TOOLS
 
     @server.list_prompts()
     async def list_prompts() -> list[Prompt]:
@@ -64,15 +81,15 @@ async def serve(
     @server.call_tool()
     async def call_tool(name, arguments: dict) -> list[TextContent]:
         if name == "search_cve":
-            return await search_cve(arguments, apikey)
+            return await search_cve(arguments, client)
         elif name == "search_release":
-            return await search_release(arguments, apikey)
+            return await search_release(arguments, client)
         elif name == "get_version_cves":
-            return await get_version_cves(arguments, apikey)
+            return await get_version_cves(arguments, client)
         elif name == "get_latest_version":
-            return await get_latest_version(arguments, apikey)
+            return await get_latest_version(arguments, client)
         elif name == "get_specific_version":
-            return await get_specific_version(arguments, apikey)
+            return await get_specific_version(arguments, client)
         else:
             raise McpError(ErrorData(code=INVALID_PARAMS, message=f"Unknown tool: {name}"))
 
@@ -81,5 +98,10 @@ async def serve(
         raise McpError(ErrorData(code=INVALID_PARAMS, message="No prompts available."))
 
     options = server.create_initialization_options()
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(read_stream, write_stream, options, raise_exceptions=True)
+    async with client:
+        request_batcher.start()
+        try:
+            async with stdio_server() as (read_stream, write_stream):
+                await server.run(read_stream, write_stream, options, raise_exceptions=True)
+        finally:
+            await request_batcher.stop()
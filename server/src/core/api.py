@@ -1,6 +1,7 @@
 import aiohttp
 from typing import Dict, Any, Optional
 from .config import Config
+from .version import get_session
 
 class OpsifyAPI:
     """Client for interacting with the Opsify API."""
@@ -8,15 +9,17 @@ class OpsifyAPI:
     def __init__(self):
         self.base_url = Config.api.base_url
         self.api_key = Config.api.api_key
+        self.release_url = f"{self.base_url}{Config.api.release_endpoint}"
         self._session: Optional[aiohttp.ClientSession] = None
 
     async def __aenter__(self):
-        self._session = aiohttp.ClientSession()
+        # Borrow the process-wide session opened and closed by main(); lifespan runs per
+        # client connection, so it must not own the session
+        self._session = await get_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self._session:
-            await self._session.close()
+        self._session = None
 
     async def get_component_version(self, component_name: str) -> Dict[str, Any]:
         """Get version information for a specific component.
@@ -34,7 +37,7 @@ class OpsifyAPI:
         if not self._session:
             raise RuntimeError("API client not initialized. Use async with context manager.")
             
-        endpoint = f"{self.base_url}{Config.api.release_endpoint}/{component_name}"
+        endpoint = f"{self.release_url}/{component_name}"
         headers = {
             "Content-Type": "application/json",
             "apikey": self.api_key
@@ -6,14 +6,17 @@ from dataclasses import dataclass
 # Load environment variables
 load_dotenv()
 
-@dataclass
+# Read up front so the in-flight limit can default to no more than the connection limit
+_MAX_CONNECTIONS = int(os.getenv("OPSIFY_MAX_CONNS", "256"))
+
+@dataclass(frozen=True, slots=True)
 class ServerConfig:
     """Server configuration settings."""
     host: str = "0.0.0.0"
     port: int = 8050
     transport: str = "sse"
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class APIConfig:
     """API configuration settings.
     The API key is read from the CHECK_API_KEY environment variable.
@@ -23,6 +26,9 @@ class APIConfig:
     release_endpoint: str = "/checks/release"
     product_endpoint: str = "/checks/product"
     cve_endpoint: str = "/checks/cve"
+    max_connections: int = 256
+    dns_cache_ttl: int = 600
+    max_inflight: int = 64
 
 class Config:
     """Core configuration settings for the DevOpsify MCP server.
@@ -42,7 +48,10 @@ class Config:
         api_key=os.getenv("CHECK_API_KEY"),
         release_endpoint="/checks/release",
         product_endpoint="/checks/product",
-        cve_endpoint="/checks/cve"
+        cve_endpoint="/checks/cve",
+        max_connections=_MAX_CONNECTIONS,
+        dns_cache_ttl=int(os.getenv("OPSIFY_DNS_CACHE_TTL", "600")),
+        max_inflight=int(os.getenv("OPSIFY_MAX_INFLIGHT", str(min(64, _MAX_CONNECTIONS))))
     )
     
     @classmethod
@@ -58,4 +67,13 @@ class Config:
             raise ValueError("TRANSPORT must be either 'sse' or 'stdio'")
             
         if not isinstance(cls.server.port, int) or cls.server.port < 1 or cls.server.port > 65535:
-            raise ValueError("PORT must be a valid port number between 1 and 65535") 
\ No newline at end of file
+            raise ValueError("PORT must be a valid port number between 1 and 65535")
+            
+        if cls.api.max_connections < 1:
+            raise ValueError("OPSIFY_MAX_CONNS must be a positive integer")
+            
+        if cls.api.dns_cache_ttl < 0:
+            raise ValueError("OPSIFY_DNS_CACHE_TTL must be zero or a positive number of seconds")
+            
+        if cls.api.max_inflight < 1 or cls.api.max_inflight > cls.api.max_connections:
+            raise ValueError("OPSIFY_MAX_INFLIGHT must be between 1 and OPSIFY_MAX_CONNS") 
\ No newline at end of file
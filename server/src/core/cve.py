@@ -1,9 +1,10 @@
-import json
 from typing import Optional
-from .version import _make_request, VersionError
+from .version import _make_request_passthrough, _drop_none, VersionError
 from .config import Config
 from mcp.server.fastmcp import Context
 
+_CVE_SEARCH_ENDPOINT = f"{Config.api.cve_endpoint}/search"
+
 async def search_cve(
     ctx: Context,
     cve_id: Optional[str] = None,
@@ -41,29 +42,28 @@ async def search_cve(
     Returns:
         str: JSON list of CVEs matching the search criteria
     """
-    params = {
-        "cve_id": cve_id,
-        "title": title,
-        "state": state,
-        "priority": priority,
-        "severity": severity,
-        "score": score,
-        "product_name": product_name,
-        "product_version": product_version,
-        "vendor": vendor,
-        "from_date": from_date,
-        "to_date": to_date,
-        "skip": skip,
-        "limit": limit
-    }
-    # Remove None values
-    params = {k: v for k, v in params.items() if v is not None}
+    params = _drop_none(
+        cve_id=cve_id,
+        title=title,
+        state=state,
+        priority=priority,
+        severity=severity,
+        score=score,
+        product_name=product_name,
+        product_version=product_version,
+        vendor=vendor,
+        from_date=from_date,
+        to_date=to_date,
+        skip=skip,
+        limit=limit
+    )
     try:
-        data = await _make_request(
+        # The API response is returned as is, so skip decoding and re-encoding it
+        body = await _make_request_passthrough(
             "GET",
-            f"{Config.api.cve_endpoint}/search",
+            _CVE_SEARCH_ENDPOINT,
             params=params
         )
-        return json.dumps(data, indent=2)
+        return body.decode()
     except VersionError as e:
         return f"Error: {str(e)}" 
\ No newline at end of file
@@ -1,9 +1,11 @@
-import json
+import orjson
 from typing import Optional
 from .version import _make_request, VersionError
 from .config import Config
 from mcp.server.fastmcp import Context
 
+_PRODUCT_ENDPOINT = Config.api.product_endpoint
+
 async def create_product(
     ctx: Context,
     product_name: str,
@@ -54,10 +56,10 @@ async def create_product(
              
         data = await _make_request(
             "POST",
-            f"{Config.api.product_endpoint}", # Use the product endpoint
+            _PRODUCT_ENDPOINT,
             json_data=payload
         )
-        return json.dumps(data, indent=2)
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
     except VersionError as e:
         return f"Error: {str(e)}"
     except Exception as e:
@@ -12,9 +12,30 @@ from typing import Optional, Dict, Any, List
 from mcp.server.fastmcp import Context
 from core.config import Config
 import aiohttp
-import json
+import asyncio
+import functools
+import logging
+import orjson
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
+# Bound once at import; configuration does not change while the server runs
+_BASE_URL = Config.api.base_url
+_RELEASE_ENDPOINT = Config.api.release_endpoint
+_RELEASE_LOAD_ENDPOINT = _RELEASE_ENDPOINT + "/load"
+_RELEASE_SEARCH_ENDPOINT = _RELEASE_ENDPOINT + "/search"
+_ALL_LATEST_ENDPOINT = _RELEASE_ENDPOINT + "/latest"
+
+# Per-product endpoints, filled in with str.format
+_LIST_TMPL = _RELEASE_ENDPOINT + "/{}"
+_LATEST_TMPL = _RELEASE_ENDPOINT + "/{}/latest"
+_SPECIFIC_TMPL = _RELEASE_ENDPOINT + "/{}/{}"
+_CVES_TMPL = _RELEASE_ENDPOINT + "/{}/{}/cves"
+
 class VersionError(Exception):
     """Base exception for version management errors."""
     pass
@@ -26,6 +47,119 @@ class VersionAPIError(VersionError):
         self.message = message
         super().__init__(f"API Error {status_code}: {message}")
 
+# Bound every upstream call so a slow API cannot stall a tool call indefinitely
+DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=5, sock_read=25)
+
+# Upper bound for composite operations that do more than a single request
+LOAD_TIMEOUT = 60
+
+class _TTLCache:
+    """Least-recently-used cache whose entries expire after a fixed time-to-live."""
+    
+    def __init__(self, maxsize: int = 512, ttl: float = 60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Any, tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Any) -> Any:
+        """Return the cached value, or None if it is missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            # Expired entries are kept until evicted so they can be revalidated
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def get_stale(self, key: Any) -> Any:
+        """Return the cached value even if it has expired, or None if missing."""
+        entry = self._entries.get(key)
+        return entry[1] if entry is not None else None
+
+    def set(self, key: Any, value: Any) -> None:
+        """Store a value, evicting the least recently used entries when full."""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def discard(self, key: Any, value: Any) -> None:
+        """Remove an entry, but only if it still holds the given value."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] is value:
+            del self._entries[key]
+
+    def invalidate(self, prefix: str) -> None:
+        """Remove every entry whose endpoint starts with the given prefix."""
+        for key in [key for key in self._entries if key[0].startswith(prefix)]:
+            del self._entries[key]
+
+@dataclass(frozen=True, slots=True)
+class _CachedResponse:
+    """A raw GET response body along with the validators needed to revalidate it."""
+    body: bytes
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+# Responses to GET requests, keyed on (endpoint, params). Values are futures of
+# _CachedResponse so concurrent identical requests share a single in-flight API call.
+_cache = _TTLCache()
+
+def invalidate(prefix: str) -> None:
+    """Drop cached GET responses for endpoints starting with prefix.
+    
+    Args:
+        prefix: Endpoint prefix (e.g., Config.api.release_endpoint)
+    """
+    _cache.invalidate(prefix)
+
+def _drop_none(**params: Any) -> Dict[str, Any]:
+    """Build a query parameter dict, leaving out parameters that are None."""
+    return {k: v for k, v in params.items() if v is not None}
+
+# Headers sent with every request; built once since they never change
+_STATIC_HEADERS = {
+    "Content-Type": "application/json",
+    "apikey": Config.api.api_key
+}
+
+# Caps concurrent API calls; sized at or below the connector limit so callers
+# wait here instead of racing inside aiohttp
+_inflight = asyncio.Semaphore(Config.api.max_inflight)
+
+# Shared HTTP session so connections (and their TLS handshakes) are reused across tool calls
+_session: Optional[aiohttp.ClientSession] = None
+
+async def get_session() -> aiohttp.ClientSession:
+    """Get the shared HTTP session, creating it on first use.
+    
+    Returns:
+        aiohttp.ClientSession: Session with a pooled, keep-alive connector
+    """
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            # All traffic goes to a single host, so the per-host limit matches the total
+            connector=aiohttp.TCPConnector(
+                limit=Config.api.max_connections,
+                limit_per_host=Config.api.max_connections,
+                use_dns_cache=True,
+                ttl_dns_cache=Config.api.dns_cache_ttl,
+                keepalive_timeout=75
+            ),
+            timeout=DEFAULT_TIMEOUT
+        )
+    return _session
+
+async def close_session() -> None:
+    """Close the shared HTTP session if it is open."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
 async def _make_request(
     method: str,
     endpoint: str,
@@ -34,6 +168,13 @@ async def _make_request(
 ) -> Dict[str, Any]:
     """Make an HTTP request to the version API.
     
+    GET responses are cached for a short time, and identical GETs that are
+    already in flight share the same API call. Expired responses are
+    revalidated with If-None-Match/If-Modified-Since, so an unchanged
+    resource costs a bodiless 304 instead of a full download. The cache holds
+    raw bodies, so a GET is decoded on every call; tools that return the
+    response unchanged should use _make_request_passthrough instead.
+    
     Args:
         method: HTTP method (GET, POST, PUT)
         endpoint: API endpoint
@@ -46,27 +187,288 @@ async def _make_request(
     Raises:
         VersionAPIError: If the API request fails
     """
-    headers = {
-        "Content-Type": "application/json",
-        "apikey": Config.api.api_key
-    }
+    if method != "GET":
+        body = orjson.dumps(json_data) if json_data is not None else None
+        return await _send_request(method, endpoint, params, body)
+    return _decode(await _cached_get(endpoint, params))
+
+async def _make_request_passthrough(
+    method: str,
+    endpoint: str,
+    params: Optional[Dict[str, str]] = None
+) -> bytes:
+    """Make an HTTP request and return the raw JSON body without decoding it.
+    
+    For tools that only hand the API response back to the client, this skips
+    a decode and re-encode pass. GETs use the same cache as _make_request.
+    
+    Args:
+        method: HTTP method (GET, DELETE)
+        endpoint: API endpoint
+        params: Query parameters
+        
+    Returns:
+        bytes: JSON response body exactly as sent by the API
+        
+    Raises:
+        VersionAPIError: If the API request fails
+    """
+    if method == "GET":
+        return await _cached_get(endpoint, params)
+    _, _, body = await _fetch(method, endpoint, params)
+    return body
+
+async def _cached_get(endpoint: str, params: Optional[Dict[str, str]]) -> bytes:
+    """GET an endpoint through the response cache and return the raw body."""
+    key = (endpoint, tuple(sorted((params or {}).items())))
+    future = _cache.get(key)
+    if future is None:
+        future = asyncio.ensure_future(_conditional_get(endpoint, params, _cache.get_stale(key)))
+        _cache.set(key, future)
+        future.add_done_callback(lambda done: _evict_failed(key, done))
+    # Shield the shared call so one cancelled caller does not cancel it for the others
+    return (await asyncio.shield(future)).body
+
+def _evict_failed(key: Any, future: asyncio.Future) -> None:
+    """Stop caching a GET that failed so the next call retries it."""
+    if future.cancelled() or future.exception() is not None:
+        _cache.discard(key, future)
+
+async def _conditional_get(
+    endpoint: str,
+    params: Optional[Dict[str, str]],
+    stale: Optional[asyncio.Future]
+) -> _CachedResponse:
+    """GET an endpoint, revalidating the expired cached response if there is one."""
+    cached = None
+    if stale is not None and stale.done() and not stale.cancelled() and stale.exception() is None:
+        cached = stale.result()
+    
+    headers = _STATIC_HEADERS
+    if cached is not None and (cached.etag or cached.last_modified):
+        headers = dict(_STATIC_HEADERS)
+        if cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
     
+    status, response_headers, body = await _fetch("GET", endpoint, params, headers=headers)
+    if status == 304 and cached is not None:
+        # Unchanged upstream; storing the new future has already renewed the expiry
+        return cached
+    return _CachedResponse(body, response_headers.get("ETag"), response_headers.get("Last-Modified"))
+
+async def _make_request_raw(method: str, endpoint: str, body: bytes) -> Dict[str, Any]:
+    """Make an HTTP request with an already encoded JSON body.
+    
+    Lets callers that receive JSON as text forward it without decoding and
+    re-encoding it. The response is never cached.
+    
+    Args:
+        method: HTTP method (POST, PUT)
+        endpoint: API endpoint
+        body: JSON-encoded request payload
+        
+    Returns:
+        Dict[str, Any]: JSON response from the API
+        
+    Raises:
+        VersionAPIError: If the API request fails
+    """
+    return await _send_request(method, endpoint, body=body)
+
+async def _send_request(
+    method: str,
+    endpoint: str,
+    params: Optional[Dict[str, str]] = None,
+    body: Optional[bytes] = None
+) -> Dict[str, Any]:
+    """Send a single HTTP request to the API, bypassing the cache.
+    
+    Raises:
+        VersionAPIError: If the API request fails
+    """
+    _, _, response_body = await _fetch(method, endpoint, params, body)
+    return _decode(response_body)
+
+def _decode(body: bytes) -> Any:
+    """Decode a JSON response body.
+    
+    Raises:
+        VersionError: If the body is not valid JSON
+    """
+    try:
+        return orjson.loads(body)
+    except orjson.JSONDecodeError as e:
+        raise VersionError(f"Invalid JSON response: {str(e)}")
+
+async def _fetch(
+    method: str,
+    endpoint: str,
+    params: Optional[Dict[str, str]] = None,
+    body: Optional[bytes] = None,
+    headers: Dict[str, str] = _STATIC_HEADERS
+) -> tuple[int, Any, bytes]:
+    """Perform an HTTP request and return its status, headers and raw body.
+    
+    A 304 Not Modified response has an empty body.
+    
+    Raises:
+        VersionAPIError: If the API responds with an error status
+        VersionError: On network errors or timeouts
+    """
+    session = await get_session()
     try:
-        async with aiohttp.ClientSession() as session:
+        async with _inflight:
             async with session.request(
                 method,
-                f"{Config.api.base_url}{endpoint}",
+                _BASE_URL + endpoint,
                 params=params,
-                json=json_data,
-                headers=headers
+                data=body,
+                headers=headers,
+                timeout=DEFAULT_TIMEOUT
             ) as response:
+                # aiohttp advertises every encoding it can decode and decompresses transparently
+                logger.debug("%s %s: Content-Encoding=%s", method, endpoint, response.headers.get("Content-Encoding"))
                 if response.status >= 400:
                     raise VersionAPIError(response.status, await response.text())
-                return await response.json()
+                if response.status == 304:
+                    return response.status, response.headers, b""
+                return response.status, response.headers, await response.read()
+    except aiohttp.ConnectionTimeoutError:
+        raise VersionError(f"Timed out connecting to the API after {DEFAULT_TIMEOUT.connect} seconds")
+    except aiohttp.SocketTimeoutError:
+        raise VersionError(f"API did not respond within {DEFAULT_TIMEOUT.sock_read} seconds")
     except aiohttp.ClientError as e:
         raise VersionError(f"Network error: {str(e)}")
-    except json.JSONDecodeError as e:
-        raise VersionError(f"Invalid JSON response: {str(e)}")
+    except asyncio.TimeoutError:
+        raise VersionError(f"Request timed out after {DEFAULT_TIMEOUT.total} seconds")
+
+# Release submissions are flushed once MAX_BATCH have queued or MAX_WAIT_MS has passed
+MAX_BATCH = 100
+MAX_WAIT_MS = 20
+
+class _ReleaseBatcher:
+    """Coalesces release submissions into batched POSTs to the release load endpoint.
+    
+    Each submitted release gets a future that resolves with the API response
+    for the batch it was sent in. If the API rejects a batch with a client
+    error, its releases are resent one at a time so that only the caller whose
+    release is invalid sees the error.
+    """
+    
+    def __init__(self, max_batch: int = MAX_BATCH, max_wait_ms: int = MAX_WAIT_MS):
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._flushes: set[asyncio.Task] = set()
+
+    def start(self) -> None:
+        """Start the background flush loop if it is not already running."""
+        if self._task is None or self._task.done():
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the flush loop, waiting for in-flight batches to finish."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+        # Fail anything that was queued but never sent
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(VersionError("Release batcher stopped before the release was sent"))
+
+    async def submit(self, release: Dict[str, Any]) -> Dict[str, Any]:
+        """Queue a release for the next batch and wait for the API response.
+        
+        Args:
+            release: Release object as accepted by the load endpoint
+            
+        Returns:
+            Dict[str, Any]: JSON response for the batch containing the release
+            
+        Raises:
+            VersionError: If the batch request fails
+        """
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((release, future))
+        return await future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            try:
+                async with asyncio.timeout_at(loop.time() + self.max_wait):
+                    while len(batch) < self.max_batch:
+                        batch.append(await self._queue.get())
+            except TimeoutError:
+                pass
+            finally:
+                # Runs on stop() too, so a partially collected batch is still sent
+                task = asyncio.create_task(self._flush(batch))
+                self._flushes.add(task)
+                task.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, batch: List[tuple[Dict[str, Any], asyncio.Future]]) -> None:
+        try:
+            data = await _make_request(
+                "POST",
+                _RELEASE_LOAD_ENDPOINT,
+                json_data=[release for release, _ in batch]
+            )
+        except VersionAPIError as e:
+            if 400 <= e.status_code < 500 and e.status_code != 429 and len(batch) > 1:
+                # The rejection may come from a single bad release, so resend each one
+                await asyncio.gather(*(self._flush([entry]) for entry in batch))
+            else:
+                self._fail(batch, e)
+            return
+        except Exception as e:
+            self._fail(batch, e)
+            return
+        # Cached release lookups may now be stale
+        invalidate(_RELEASE_ENDPOINT)
+        for _, future in batch:
+            if not future.done():
+                future.set_result(data)
+
+    @staticmethod
+    def _fail(batch: List[tuple[Dict[str, Any], asyncio.Future]], error: Exception) -> None:
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(error)
+
+release_batcher = _ReleaseBatcher()
+
+def _require_str_version(fn):
+    """Decorate a version tool to validate its version argument and report API errors.
+    
+    Raises TypeError when version is not a string, and turns a VersionError
+    from the wrapped tool into an "Error: ..." result.
+    """
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        # version is the third positional parameter, after ctx and product_name
+        version = kwargs.get("version", args[2] if len(args) > 2 else None)
+        if version is not None and not isinstance(version, str):
+            raise TypeError("Version must be provided as a string, e.g., '1.23' not 1.23")
+        try:
+            return await fn(*args, **kwargs)
+        except VersionError as e:
+            return f"Error: {str(e)}"
+    return wrapper
 
 async def get_latest_version(ctx: Context, product_name: str, vendor: Optional[str] = None) -> str:
     """Get the latest version information for a product.
@@ -80,16 +482,12 @@ async def get_latest_version(ctx: Context, product_name: str, vendor: Optional[s
         str: JSON with latest version details
     """
     try:
-        # Build the endpoint with optional vendor parameter
-        endpoint = f"{Config.api.release_endpoint}/{product_name}/latest"
-        if vendor:
-            endpoint = f"{endpoint}?vendor={vendor}"
-            
-        data = await _make_request(
+        body = await _make_request_passthrough(
             "GET",
-            endpoint
+            _LATEST_TMPL.format(product_name),
+            params={"vendor": vendor} if vendor else None
         )
-        return json.dumps(data, indent=2)
+        return body.decode()
     except VersionError as e:
         return f"Error: {str(e)}"
 
@@ -105,19 +503,16 @@ async def get_versions(ctx: Context, product_name: str, vendor: Optional[str] =
         str: JSON array of version entries for the product
     """
     try:
-        # Build the endpoint with optional vendor parameter
-        endpoint = f"{Config.api.release_endpoint}/{product_name}"
-        if vendor:
-            endpoint = f"{endpoint}?vendor={vendor}"
-            
-        data = await _make_request(
+        body = await _make_request_passthrough(
             "GET",
-            endpoint
+            _LIST_TMPL.format(product_name),
+            params={"vendor": vendor} if vendor else None
         )
-        return json.dumps(data, indent=2)
+        return body.decode()
     except VersionError as e:
         return f"Error: {str(e)}"
 
+@_require_str_version
 async def get_specific_version(
     ctx: Context,
     product_name: str,
@@ -146,23 +541,14 @@ async def get_specific_version(
     Raises:
         TypeError: If version is not provided as a string
     """
-    if not isinstance(version, str):
-        raise TypeError("Version must be provided as a string, e.g., '1.23' not 1.23")
-        
-    try:
-        # Build the endpoint with optional vendor parameter
-        endpoint = f"{Config.api.release_endpoint}/{product_name}/{version}"
-        if vendor:
-            endpoint = f"{endpoint}?vendor={vendor}"
-            
-        data = await _make_request(
-            "GET",
-            endpoint
-        )
-        return json.dumps(data, indent=2)
-    except VersionError as e:
-        return f"Error: {str(e)}"
+    body = await _make_request_passthrough(
+        "GET",
+        _SPECIFIC_TMPL.format(product_name, version),
+        params={"vendor": vendor} if vendor else None
+    )
+    return body.decode()
 
+@_require_str_version
 async def create_version(
     ctx: Context,
     product_name: str,
@@ -201,25 +587,17 @@ async def create_version(
     WARNING:
         If you pass a number for 'version', it will cause an error. Always use quotes to ensure it is a string.
     """
-    if not isinstance(version, str):
-        raise TypeError("Version must be provided as a string, e.g., '1.23' not 1.23")
-    try:
-        data = await _make_request(
-            "POST",
-            f"{Config.api.release_endpoint}",
-            json_data={
-                "product_name": product_name,
-                "version": version,
-                "release_date": release_date,
-                "active_support_end_date": active_support_end_date,
-                "security_support_end_date": security_support_end_date,
-                "eol_date": eol_date
-            }
-        )
-        return json.dumps(data, indent=2)
-    except VersionError as e:
-        return f"Error: {str(e)}"
+    data = await release_batcher.submit({
+        "product_name": product_name,
+        "version": version,
+        "release_date": release_date,
+        "active_support_end_date": active_support_end_date,
+        "security_support_end_date": security_support_end_date,
+        "eol_date": eol_date
+    })
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
 
+@_require_str_version
 async def update_version(
     ctx: Context,
     product_name: str,
@@ -248,22 +626,19 @@ async def update_version(
           These values cannot be changed in an update operation.
         - Both simple date format (YYYY-MM-DD) and ISO 8601 datetime format are supported for all date fields.
     """
-    if not isinstance(version, str):
-        raise TypeError("Version must be provided as a string, e.g., '1.23' not 1.23")
-    try:
-        data = await _make_request(
-            "PUT",
-            f"{Config.api.release_endpoint}/{product_name}/{version}",
-            json_data={
-                "release_date": release_date,
-                "active_support_end_date": active_support_end_date,
-                "security_support_end_date": security_support_end_date,
-                "eol_date": eol_date
-            }
-        )
-        return json.dumps(data, indent=2)
-    except VersionError as e:
-        return f"Error: {str(e)}"
+    data = await _make_request(
+        "PUT",
+        _SPECIFIC_TMPL.format(product_name, version),
+        json_data={
+            "release_date": release_date,
+            "active_support_end_date": active_support_end_date,
+            "security_support_end_date": security_support_end_date,
+            "eol_date": eol_date
+        }
+    )
+    # Cached release lookups may now be stale
+    invalidate(_RELEASE_ENDPOINT)
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
 
 async def delete_version(
     ctx: Context,
@@ -283,12 +658,14 @@ async def delete_version(
     try:
         await _make_request(
             "DELETE",
-            f"{Config.api.release_endpoint}/{product_name}/{version}"
+            _SPECIFIC_TMPL.format(product_name, version)
         )
-        return json.dumps({
+        # Cached release lookups may now be stale
+        invalidate(_RELEASE_ENDPOINT)
+        return orjson.dumps({
             "status": "success",
             "message": f"Version {version} of product {product_name} deleted successfully"
-        }, indent=2)
+        }, option=orjson.OPT_INDENT_2).decode()
     except VersionError as e:
         return f"Error: {str(e)}"
 
@@ -324,12 +701,13 @@ async def get_all_versions(
         if vendor:
             params["vendor"] = vendor
             
-        data = await _make_request(
+        # The API response is returned as is, so skip decoding and re-encoding it
+        body = await _make_request_passthrough(
             "GET",
-            f"{Config.api.release_endpoint}",
+            _RELEASE_ENDPOINT,
             params=params
         )
-        return json.dumps(data, indent=2)
+        return body.decode()
     except VersionError as e:
         return f"Error: {str(e)}"
 
@@ -365,12 +743,13 @@ async def get_all_latest_versions(
         if vendor:
             params["vendor"] = vendor
             
-        data = await _make_request(
+        # The API response is returned as is, so skip decoding and re-encoding it
+        body = await _make_request_passthrough(
             "GET",
-            f"{Config.api.release_endpoint}/latest",
+            _ALL_LATEST_ENDPOINT,
             params=params
         )
-        return json.dumps(data, indent=2)
+        return body.decode()
     except VersionError as e:
         return f"Error: {str(e)}"
 
@@ -432,18 +811,24 @@ async def load_versions(ctx: Context, releases: str) -> str:
        - eol_date (YYYY-MM-DD or ISO 8601 datetime)
     """
     try:
-        # Parse the releases string to validate JSON
-        releases_data = json.loads(releases)
-        
-        # Send to API
-        data = await _make_request(
-            "POST",
-            f"{Config.api.release_endpoint}/load",
-            json_data=releases_data
-        )
-        return json.dumps(data, indent=2)
-    except json.JSONDecodeError as e:
+        async with asyncio.timeout(LOAD_TIMEOUT):
+            # Parse the releases string only to validate JSON
+            orjson.loads(releases)
+            
+            # Send the caller's payload as is; it is already a complete batch,
+            # so it skips the release batcher and a second encoding pass
+            data = await _make_request_raw(
+                "POST",
+                _RELEASE_LOAD_ENDPOINT,
+                body=releases.encode() if isinstance(releases, str) else releases
+            )
+        # Cached release lookups may now be stale
+        invalidate(_RELEASE_ENDPOINT)
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    except orjson.JSONDecodeError as e:
         return f"Error: Invalid JSON format - {str(e)}"
+    except TimeoutError:
+        return f"Error: Loading releases timed out after {LOAD_TIMEOUT} seconds"
     except VersionError as e:
         return f"Error: {str(e)}"
 
@@ -479,27 +864,27 @@ async def search_releases(
         search_releases(ctx, from_date="2024-01-01T00:00:00Z", to_date="2024-12-31T23:59:59Z")  # ISO datetime format
     """
     try:
-        params = {
-            "vendor": vendor,
-            "product_name": product_name,
-            "from_date": from_date,
-            "to_date": to_date,
-            "date_field": date_field,
-            "page": str(page),
-            "page_size": str(page_size)
-        }
-        # Remove None values
-        params = {k: v for k, v in params.items() if v is not None}
+        params = _drop_none(
+            vendor=vendor,
+            product_name=product_name,
+            from_date=from_date,
+            to_date=to_date,
+            date_field=date_field,
+            page=str(page),
+            page_size=str(page_size)
+        )
         
-        data = await _make_request(
+        # The API response is returned as is, so skip decoding and re-encoding it
+        body = await _make_request_passthrough(
             "GET",
-            f"{Config.api.release_endpoint}/search",
+            _RELEASE_SEARCH_ENDPOINT,
             params=params
         )
-        return json.dumps(data, indent=2)
+        return body.decode()
     except VersionError as e:
         return f"Error: {str(e)}"
 
+@_require_str_version
 async def get_version_cves(
     ctx: Context,
     product_name: str,
@@ -526,19 +911,9 @@ async def get_version_cves(
         TypeError: If version is not provided as a string
         VersionError: If the API request fails
     """
-    if not isinstance(version, str):
-        raise TypeError("Version must be provided as a string, e.g., '1.0.0' not 1.0")
-        
-    try:
-        # Build the endpoint with optional vendor parameter
-        endpoint = f"{Config.api.release_endpoint}/{product_name}/{version}/cves"
-        if vendor:
-            endpoint = f"{endpoint}?vendor={vendor}"
-            
-        data = await _make_request(
-            "GET",
-            endpoint
-        )
-        return json.dumps(data, indent=2)
-    except VersionError as e:
-        return f"Error: {str(e)}" 
\ No newline at end of file
+    body = await _make_request_passthrough(
+        "GET",
+        _CVES_TMPL.format(product_name, version),
+        params={"vendor": vendor} if vendor else None
+    )
+    return body.decode()
@@ -5,6 +5,12 @@ from dataclasses import dataclass
 from dotenv import load_dotenv
 import asyncio
 import uuid
+
+try:
+    import uvloop
+except ImportError:
+    # uvloop is not available on Windows; fall back to the default event loop
+    uvloop = None
 from core.config import Config
 from core.version import (
     get_latest_version,
@@ -17,7 +23,10 @@ from core.version import (
     delete_version,
     load_versions,
     search_releases,
-    get_version_cves
+    get_version_cves,
+    get_session,
+    close_session,
+    release_batcher
 )
 from core.product import create_product
 from core.cve import (    
@@ -26,13 +35,6 @@ from core.cve import (
 
 load_dotenv()
 
-def format_session_id(session_id: str) -> str:
-    """Format session ID to ensure consistent format."""
-    # Remove any hyphens and convert to lowercase
-    clean_id = session_id.replace('-', '').lower()
-    # Add hyphens in the correct positions
-    return f"{clean_id[:8]}-{clean_id[8:12]}-{clean_id[12:16]}-{clean_id[16:20]}-{clean_id[20:]}"
-
 # Create a dataclass for our application context
 @dataclass
 class DemoContext:
@@ -54,8 +56,8 @@ async def lifespan(server: FastMCP) -> AsyncIterator[DemoContext]:
     try:
         # Validate configuration before starting
         Config.validate_config()
-        # Generate a new session ID
-        session_id = format_session_id(str(uuid.uuid4()))
+        # Generate a new session ID (already in canonical lowercase hyphenated form)
+        session_id = str(uuid.uuid4())
         context = DemoContext(session_id=session_id)
         yield context
     except Exception as e:
@@ -78,31 +80,40 @@ mcp = FastMCP(
     session_cleanup_interval=300  # Clean up expired sessions every 5 minutes
 )
 
-# Register version management tools
-#mcp.tool()(get_versions)
-#
-#mcp.tool()(create_version)
-#mcp.tool()(update_version)
-#mcp.tool()(get_all_versions)
-#mcp.tool()(get_all_latest_versions)
-#mcp.tool()(delete_version)
-#mcp.tool()(load_versions)
-#mcp.tool()(create_product)
-
-mcp.tool()(search_cve)
-mcp.tool()(search_releases)
-mcp.tool()(get_version_cves)
+# Tools exposed to MCP clients. The version management tools (get_versions,
+# create_version, update_version, get_all_versions, get_all_latest_versions,
+# delete_version, load_versions, create_product) are intentionally not registered.
+TOOLS = [
+    search_cve,
+    search_releases,
+    get_version_cves,
+    get_latest_version,
+    get_specific_version,
+]
 
-mcp.tool()(get_latest_version)
-mcp.tool()(get_specific_version)
+# A single decorator instance registers every tool
+register_tool = mcp.tool()
+for tool in TOOLS:
+    register_tool(tool)
 
 async def main():
-    if Config.server.transport == 'sse':
-        # Run the MCP server with sse transport
-        await mcp.run_sse_async()
-    else:
-        # Run with default transport
-        await mcp.run_async()
+    # The HTTP session and release batcher are shared by every client connection,
+    # so they are owned by the process rather than the per-connection lifespan
+    await get_session()
+    release_batcher.start()
+    try:
+        if Config.server.transport == 'sse':
+            # Run the MCP server with sse transport
+            await mcp.run_sse_async()
+        else:
+            # Run with default transport
+            await mcp.run_async()
+    finally:
+        await release_batcher.stop()
+        await close_session()
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())